@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import functools
+import hashlib
 import logging
 import os
 import shutil
@@ -10,6 +12,7 @@ from dataclasses import (
 from enum import Enum
 from pathlib import Path
 from typing import (
+    ClassVar,
     List,
     Optional,
     Sequence,
@@ -47,9 +50,35 @@ class Config:
 CONFIG = Config()
 
 
+@functools.lru_cache(maxsize=1)
+def _lock_hash() -> Optional[str]:
+    """Compute the sha256 of poetry.lock once per process."""
+    lock_file = Path(__file__).parent / "poetry.lock"
+    if not lock_file.is_file():
+        return None
+    return hashlib.sha256(lock_file.read_bytes()).hexdigest()
+
+
+@functools.lru_cache
+def _compute_venv_env(venv_location: str, base_path: str) -> tuple[tuple[str, str], ...]:
+    """Build the virtualenv environment variables once per venv and PATH."""
+    venv_path = Path(venv_location)
+    bin_dir = "Scripts" if os.name == "nt" else "bin"
+
+    if not venv_path.exists():
+        raise RuntimeError(f"Virtualenv not found at {venv_path}")
+
+    return (
+        ("VIRTUAL_ENV", str(venv_path)),
+        ("PATH", os.pathsep.join([str(venv_path / bin_dir), base_path])),
+    )
+
+
 class Poetry:
     """Poetry dependency manager."""
 
+    _poetry_verified: ClassVar[bool] = False
+
     @staticmethod
     def install(
         session: Session,
@@ -61,6 +90,13 @@ class Poetry:
         Poetry._setup_virtual_env(session)
         Poetry._ensure_poetry_installed(session)
 
+        session.env.setdefault("POETRY_CACHE_DIR", str(Path(".nox") / ".poetry-cache"))
+
+        marker = Poetry._install_marker(session, groups)
+        if marker is not None and Poetry._is_install_cached(session, marker):
+            logger.info("Dependencies unchanged since last install; skipping Poetry")
+            return
+
         cmd = ["poetry", "install", "--sync"]
         if groups:
             for group in groups:
@@ -74,41 +110,128 @@ class Poetry:
             logger.error(f"Command failed: {cmd}")
             session.error(f"Failed to install dependencies with Poetry. Error: {e}")
 
+        if marker is not None:
+            Poetry._write_install_marker(session, marker)
+
     @staticmethod
     def _setup_virtual_env(session: Session) -> None:
         """Configure virtualenv environment variables."""
-        venv_path = Path(session.virtualenv.location)
-        bin_dir = "Scripts" if os.name == "nt" else "bin"
-
-        if not venv_path.exists():
-            raise RuntimeError(f"Virtualenv not found at {venv_path}")
-
         session.env.update(
-            {
-                "VIRTUAL_ENV": str(venv_path),
-                "PATH"       : os.pathsep.join([str(venv_path / bin_dir), os.environ.get("PATH", "")]),
-            }
+            dict(
+                _compute_venv_env(
+                    session.virtualenv.location,
+                    os.environ.get("PATH", ""),
+                )
+            )
         )
 
+    @staticmethod
+    def _install_marker(session: Session, groups: Optional[Sequence[str]]) -> Optional[str]:
+        """Build the cache marker for the current lockfile and group selection."""
+        lock_hash = _lock_hash()
+        if lock_hash is None:
+            return None
+        return f"{lock_hash}:{','.join(sorted(groups or ()))}"
+
+    @staticmethod
+    def _marker_path(session: Session) -> Path:
+        return Path(session.virtualenv.location) / ".poetry-installed-hash"
+
+    @staticmethod
+    def _is_install_cached(session: Session, marker: str) -> bool:
+        """Check whether the venv already holds an install for this marker."""
+        try:
+            return Poetry._marker_path(session).read_text() == marker
+        except OSError:
+            return False
+
+    @staticmethod
+    def _write_install_marker(session: Session, marker: str) -> None:
+        try:
+            Poetry._marker_path(session).write_text(marker)
+        except OSError as e:
+            logger.warning(f"Failed to write Poetry install marker: {e}")
+
     @staticmethod
     def _ensure_poetry_installed(session: Session) -> None:
         """Ensure Poetry is installed in the session."""
+        if Poetry._poetry_verified:
+            return
+
+        # On reused venvs the Poetry executable is already present; a stat
+        # is much cheaper than spawning the version probe.
+        bin_dir = "Scripts" if os.name == "nt" else "bin"
+        exe = "poetry.exe" if os.name == "nt" else "poetry"
+        if (Path(session.virtualenv.location) / bin_dir / exe).exists():
+            Poetry._poetry_verified = True
+            return
+
         try:
             session.run("poetry", "--version", external=True, silent=True, success_codes=[0])
         except Exception:
             session.run("python", "-m", "pip", "install", "poetry>=1.7.0", external=True)
+        Poetry._poetry_verified = True
 
 
-def docker_compose_command(command: str) -> List[str]:
-    """Generate the appropriate docker compose command based on version."""
+@functools.lru_cache(maxsize=1)
+def _resolve_compose() -> tuple[str, ...]:
+    """Resolve the Docker Compose executable once per process."""
     if shutil.which("docker-compose"):
-        return ["docker-compose", command]
+        return ("docker-compose",)
     elif shutil.which("docker"):
-        return ["docker", "compose", command]
+        return ("docker", "compose")
     else:
         raise RuntimeError("Docker Compose is not installed. Please install it to proceed.")
 
 
+def docker_compose_command(command: str) -> List[str]:
+    """Generate the appropriate docker compose command based on version."""
+    return [*_resolve_compose(), command]
+
+
+_DEV_REQS = Path(".nox") / ".dev-reqs.txt"
+_DEV_REQS_HASH = Path(".nox") / ".dev-reqs.hash"
+
+
+def _install_dev_tools(session: Session) -> None:
+    """
+    Install the dev tool group without running the Poetry resolver.
+
+    Exports the dev group to a pinned requirements file once per lockfile
+    and installs from that; falls back to a full Poetry install when the
+    export is stale or unavailable.
+    """
+    lock_hash = _lock_hash()
+    if lock_hash is not None:
+        try:
+            export_fresh = (
+                _DEV_REQS.is_file() and _DEV_REQS_HASH.read_text() == lock_hash
+            )
+        except OSError:
+            export_fresh = False
+
+        if not export_fresh:
+            Poetry._setup_virtual_env(session)
+            Poetry._ensure_poetry_installed(session)
+            try:
+                _DEV_REQS.parent.mkdir(parents=True, exist_ok=True)
+                session.run(
+                    "poetry", "export", "--only", "dev",
+                    "-f", "requirements.txt", "-o", str(_DEV_REQS),
+                    external=True,
+                )
+                _DEV_REQS_HASH.write_text(lock_hash)
+                export_fresh = True
+            except Exception as e:
+                logger.warning(f"Failed to export dev requirements: {e}")
+
+        if export_fresh:
+            session.install("-r", str(_DEV_REQS))
+            return
+
+    Poetry.install(session, groups=["dev"])
+
+
 nox.options.sessions = ["tests", "lint", "typecheck"]
 
 
@@ -146,7 +269,7 @@ def tests(session: Session) -> None:
 @nox.session(python=[CONFIG.DEFAULT_VERSION], reuse_venv=CONFIG.REUSE_VENV)
 def lint(session: Session) -> None:
     """Run code quality checks."""
-    Poetry.install(session, groups=["dev"])
+    _install_dev_tools(session)
     session.run("black", "--check", *CONFIG.PROJECT_DIRS)
     session.run("ruff", "check", *CONFIG.PROJECT_DIRS)
 
@@ -154,5 +277,5 @@ def lint(session: Session) -> None:
 @nox.session(python=[CONFIG.DEFAULT_VERSION], reuse_venv=CONFIG.REUSE_VENV)
 def typecheck(session: Session) -> None:
     """Run static type checking."""
-    Poetry.install(session, groups=["dev"])
+    _install_dev_tools(session)
     session.run("mypy", *CONFIG.PROJECT_DIRS)
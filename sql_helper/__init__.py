@@ -1,18 +1,23 @@
-from sql_helper.core import (
-    DatabaseError,
-    ErrorCode,
-    NotFoundError,
-    SQLHelperException,
-    ValidationError,
-    set_logger,
-)
-from sql_helper.database import (
-    Database,
-    DatabaseConfig,
-    DatabaseCredentials,
-    DatabaseType,
-    SSLConfig,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from sql_helper.core import (
+        DatabaseError,
+        ErrorCode,
+        NotFoundError,
+        SQLHelperException,
+        ValidationError,
+        set_logger,
+    )
+    from sql_helper.database import (
+        Database,
+        DatabaseConfig,
+        DatabaseCredentials,
+        DatabaseType,
+        SSLConfig,
+    )
+
 __all__ = [
     # Core
     "DatabaseError",
@@ -22,10 +27,43 @@ __all__ = [
     "ValidationError",
     "set_logger",
 
-    # Database  
+    # Database
     "Database",
     "DatabaseConfig",
     "DatabaseCredentials",
     "DatabaseType",
     "SSLConfig",
 ]
+
+# PEP 562 lazy exports: resolve each name on first access so importing
+# sql_helper does not eagerly load the SQLAlchemy-backed submodules.
+_LAZY = {
+    # Core
+    "DatabaseError"      : ("sql_helper.core", "DatabaseError"),
+    "ErrorCode"          : ("sql_helper.core", "ErrorCode"),
+    "NotFoundError"      : ("sql_helper.core", "NotFoundError"),
+    "SQLHelperException" : ("sql_helper.core", "SQLHelperException"),
+    "ValidationError"    : ("sql_helper.core", "ValidationError"),
+    "set_logger"         : ("sql_helper.core", "set_logger"),
+
+    # Database
+    "Database"           : ("sql_helper.database", "Database"),
+    "DatabaseConfig"     : ("sql_helper.database", "DatabaseConfig"),
+    "DatabaseCredentials": ("sql_helper.database", "DatabaseCredentials"),
+    "DatabaseType"       : ("sql_helper.database", "DatabaseType"),
+    "SSLConfig"          : ("sql_helper.database", "SSLConfig"),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
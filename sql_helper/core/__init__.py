@@ -1,17 +1,20 @@
-from .exceptions import (
-    DatabaseError,
-    ErrorCode,
-    NotFoundError,
-    NotFoundError,
-    SQLHelperException,
-    ValidationError,
-    format_error_details,
-)
-from .logging import (
-    Logger,
-    get_logger,
-    set_logger,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .exceptions import (
+        DatabaseError,
+        ErrorCode,
+        NotFoundError,
+        SQLHelperException,
+        ValidationError,
+        format_error_details,
+    )
+    from .logging import (
+        Logger,
+        get_logger,
+        set_logger,
+    )
 
 __all__ = [
     "DatabaseError",
@@ -24,3 +27,30 @@ __all__ = [
     "get_logger",
     "set_logger",
 ]
+
+# PEP 562 lazy exports keyed by attribute name, matching the package root.
+_LAZY = {
+    "DatabaseError"       : ("sql_helper.core.exceptions", "DatabaseError"),
+    "ErrorCode"           : ("sql_helper.core.exceptions", "ErrorCode"),
+    "NotFoundError"       : ("sql_helper.core.exceptions", "NotFoundError"),
+    "SQLHelperException"  : ("sql_helper.core.exceptions", "SQLHelperException"),
+    "ValidationError"     : ("sql_helper.core.exceptions", "ValidationError"),
+    "format_error_details": ("sql_helper.core.exceptions", "format_error_details"),
+    "Logger"              : ("sql_helper.core.logging", "Logger"),
+    "get_logger"          : ("sql_helper.core.logging", "get_logger"),
+    "set_logger"          : ("sql_helper.core.logging", "set_logger"),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,18 +1,16 @@
+import logging
 from enum import (
     Enum,
 )
 from typing import (
     Any,
+    ClassVar,
     Dict,
     Optional,
-    TYPE_CHECKING,
     TypeAlias,
     Union,
 )
 
-if TYPE_CHECKING:
-    from .logging import Logger
-
 from .logging import get_logger
 
 ErrorDetails: TypeAlias = Dict[str, Any]
@@ -37,17 +35,15 @@ class SQLHelperException(Exception):
         details (Dict[str, Any]): Additional error details
     """
 
-    if TYPE_CHECKING:
-        _logger: Logger
-
-    _logger = get_logger()
+    __slots__ = ("message", "code", "details", "parent")
 
     def __init__(
         self,
         message: str,
         code: Union[ErrorCode, str] = ErrorCode.INTERNAL_ERROR,
         details: Optional[ErrorDetails] = None,
-        parent: Optional[Exception] = None
+        parent: Optional[Exception] = None,
+        log: bool = True
     ) -> None:
         """
         Initialize SQLHelper exception.
@@ -56,17 +52,29 @@ class SQLHelperException(Exception):
             message: Human-readable error message
             code: Error code for categorizing errors
             details: Additional error details
+            log: Whether to log the error on construction. Pass False when
+                the caller has already logged it.
         """
         self.message = message
-        self.code = ErrorCode(code) if isinstance(code, str) else code
+        self.code = code if code.__class__ is ErrorCode else ErrorCode(code)
         self.details = details or {}
         self.parent = parent
 
-        self._log_error()
+        if log:
+            self._log_error()
         super().__init__(message)
 
     def _log_error(self) -> None:
         """Log the error with structured details."""
+        # Resolved lazily so importing this module has no logging side
+        # effects and a later set_logger() call is honored.
+        logger = get_logger()
+
+        # Custom Logger implementations may not expose isEnabledFor.
+        is_enabled_for = getattr(logger, "isEnabledFor", None)
+        if is_enabled_for is not None and not is_enabled_for(logging.ERROR):
+            return
+
         log_details = {
             "error_code"   : self.code.value,
             "error_message": self.message,
@@ -78,7 +86,7 @@ class SQLHelperException(Exception):
             log_details["parent_error"] = str(self.parent)
             log_details["parent_type"] = type(self.parent).__name__
 
-        self._logger.error(f"Exception occurred: {self.code}", extra=log_details)
+        logger.error("Exception occurred: %s", self.code.value, extra=log_details)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -108,10 +116,15 @@ class SQLHelperException(Exception):
 class DatabaseError(SQLHelperException):
     """Exception raised for database-related errors."""
 
+    __slots__ = ()
+
+    CODE: ClassVar[ErrorCode] = ErrorCode.DATABASE_ERROR
+
     def __init__(
         self,
         message: str = "Database error occurred",
-        details: Optional[Dict[str, Any]] = None
+        details: Optional[Dict[str, Any]] = None,
+        log: bool = True
     ) -> None:
         """
         Initialize database error.
@@ -122,18 +135,24 @@ class DatabaseError(SQLHelperException):
         """
         super().__init__(
             message=message,
-            code=ErrorCode.DATABASE_ERROR,
-            details=details
+            code=type(self).CODE,
+            details=details,
+            log=log
         )
 
 
 class NotFoundError(SQLHelperException):
     """Exception raised when a requested resource is not found."""
 
+    __slots__ = ()
+
+    CODE: ClassVar[ErrorCode] = ErrorCode.NOT_FOUND
+
     def __init__(
         self,
         message: str = "Resource not found",
-        details: Optional[Dict[str, Any]] = None
+        details: Optional[Dict[str, Any]] = None,
+        log: bool = True
     ) -> None:
         """
         Initialize not found error.
@@ -144,18 +163,24 @@ class NotFoundError(SQLHelperException):
         """
         super().__init__(
             message=message,
-            code=ErrorCode.NOT_FOUND,
-            details=details
+            code=type(self).CODE,
+            details=details,
+            log=log
         )
 
 
 class ValidationError(SQLHelperException):
     """Exception raised for validation errors."""
 
+    __slots__ = ()
+
+    CODE: ClassVar[ErrorCode] = ErrorCode.VALIDATION_ERROR
+
     def __init__(
         self,
         message: str = "Validation error occurred",
-        details: Optional[Dict[str, Any]] = None
+        details: Optional[Dict[str, Any]] = None,
+        log: bool = True
     ) -> None:
         """
         Initialize validation error.
@@ -166,8 +191,9 @@ class ValidationError(SQLHelperException):
         """
         super().__init__(
             message=message,
-            code=ErrorCode.VALIDATION_ERROR,
-            details=details
+            code=type(self).CODE,
+            details=details,
+            log=log
         )
 
 
@@ -20,17 +20,12 @@ class Logger(Protocol):
 
 class SQLHelperLogger:
     """
-    Singleton logger manager for SQLHelper library.
+    Logger manager for SQLHelper library.
     Handles default logging configuration and custom logger injection.
+    All state lives at class level; the class is never instantiated.
     """
-    _instance = None
     _logger: Optional[Logger] = None
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
     @classmethod
     def get_logger(cls) -> Logger:
         """Returns the currently configured logger instance"""
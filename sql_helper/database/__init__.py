@@ -1,10 +1,14 @@
-from .config import (
-    DatabaseConfig,
-    DatabaseCredentials,
-    SSLConfig,
-)
-from .database import Database
-from .types import DatabaseType
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import (
+        DatabaseConfig,
+        DatabaseCredentials,
+        SSLConfig,
+    )
+    from .database import Database
+    from .types import DatabaseType
 
 __all__ = [
     "Database",
@@ -13,3 +17,26 @@ __all__ = [
     "DatabaseType",
     "SSLConfig",
 ]
+
+# PEP 562 lazy exports keyed by attribute name, matching the package root.
+_LAZY = {
+    "Database"           : ("sql_helper.database.database", "Database"),
+    "DatabaseConfig"     : ("sql_helper.database.config", "DatabaseConfig"),
+    "DatabaseCredentials": ("sql_helper.database.config", "DatabaseCredentials"),
+    "DatabaseType"       : ("sql_helper.database.types", "DatabaseType"),
+    "SSLConfig"          : ("sql_helper.database.config", "SSLConfig"),
+}
+
+
+def __getattr__(name: str):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,10 @@
+import functools
 import os
+import stat
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import (
+    Mapping,
     Optional,
     Protocol,
 )
@@ -30,11 +34,21 @@ class SSLConfig:
 
     def __post_init__(self):
         """Validate SSL configuration."""
-        if self.enabled:
-            for field in ["ca_cert", "client_cert", "client_key"]:
-                value = getattr(self, field)
-                if value and not os.path.isfile(value):
-                    raise ValueError(f"Invalid file path for {field}: {value}")
+        if not self.enabled:
+            return
+        for field, value in (
+            ("ca_cert", self.ca_cert),
+            ("client_cert", self.client_cert),
+            ("client_key", self.client_key),
+        ):
+            if value is None:
+                continue
+            try:
+                st = os.stat(value)
+            except OSError:
+                raise ValueError(f"Invalid file path for {field}: {value}") from None
+            if not stat.S_ISREG(st.st_mode):
+                raise ValueError(f"Invalid file path for {field}: {value}")
 
 
 class DatabaseConfigProtocol(Protocol):
@@ -77,7 +91,7 @@ class DatabaseConfig:
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
-        DatabaseConfigValidator.validate(self)
+        _validate_cfg(self)
 
     @property
     def url(self) -> str:
@@ -90,20 +104,43 @@ class DatabaseConfig:
         return DatabaseURLBuilder.build_url(self, async_mode=True)
 
     @property
-    def pool_settings(self) -> dict:
+    def pool_settings(self) -> Mapping:
         """Get connection pool settings."""
-        return {
-            "pool_size"    : self.pool_size,
-            "max_overflow" : self.max_overflow,
-            "pool_timeout" : self.pool_timeout,
-            "pool_recycle" : self.pool_recycle,
-            "pool_pre_ping": self.pool_pre_ping,
-        }
+        return _build_pool_settings(self)
 
     @property
-    def engine_settings(self) -> dict:
+    def engine_settings(self) -> Mapping:
         """Get engine configuration settings."""
-        return {
-            "echo": self.echo_sql,
-            **self.pool_settings
+        return _build_engine_settings(self)
+
+
+@functools.lru_cache(maxsize=128)
+def _validate_cfg(config: DatabaseConfig) -> None:
+    """Validate a config once; identical frozen configs skip re-validation."""
+    DatabaseConfigValidator.validate(config)
+
+
+# DatabaseConfig is frozen (hashable), so derived settings are memoized
+# per config instead of being rebuilt on every property access. URLs are
+# cached inside DatabaseURLBuilder itself.
+@functools.lru_cache(maxsize=128)
+def _build_pool_settings(config: DatabaseConfig) -> Mapping:
+    return MappingProxyType(
+        {
+            "pool_size"    : config.pool_size,
+            "max_overflow" : config.max_overflow,
+            "pool_timeout" : config.pool_timeout,
+            "pool_recycle" : config.pool_recycle,
+            "pool_pre_ping": config.pool_pre_ping,
+        }
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _build_engine_settings(config: DatabaseConfig) -> Mapping:
+    return MappingProxyType(
+        {
+            "echo": config.echo_sql,
+            **config.pool_settings,
         }
+    )
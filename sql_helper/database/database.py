@@ -6,22 +6,15 @@ from contextlib import (
 )
 from typing import (
     AsyncGenerator,
+    ClassVar,
+    Dict,
     Generator,
     Optional,
     TYPE_CHECKING,
     Union,
 )
 
-from sqlalchemy.ext.asyncio import (
-    async_sessionmaker,
-)
-from sqlalchemy.orm import (
-    Session,
-    sessionmaker,
-)
-
 from .config import DatabaseConfig
-from .engine import EngineFactory
 from ..core import (
     DatabaseError,
     format_error_details,
@@ -36,8 +29,13 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import (
         AsyncEngine,
         AsyncSession,
+        async_sessionmaker,
     )
     from sqlalchemy.ext.asyncio.engine import AsyncConnection
+    from sqlalchemy.orm import (
+        Session,
+        sessionmaker,
+    )
     from ..core import Logger
 
     # Type aliases
@@ -53,6 +51,11 @@ class Database:
     Supports both synchronous and asynchronous operations.
     """
 
+    # Engines are shared across Database instances with equal configs so
+    # short-lived instances do not pay engine construction repeatedly.
+    _sync_engines: ClassVar[Dict[DatabaseConfig, "Engine"]] = {}
+    _async_engines: ClassVar[Dict[DatabaseConfig, "AsyncEngine"]] = {}
+
     if TYPE_CHECKING:
         config: DatabaseConfig
         _logger: Logger
@@ -78,8 +81,19 @@ class Database:
         self._is_sync_initialized = False
         self._is_async_initialized = False
 
+    @classmethod
+    def clear_pool(cls) -> None:
+        """
+        Forget all shared engines without disposing them.
+        Subsequent initializations will create fresh engines.
+        """
+        cls._sync_engines.clear()
+        cls._async_engines.clear()
+
     def _create_engine(self, async_mode: bool = False) -> Union[Engine, AsyncEngine]:
         """Create database engine based on mode."""
+        from .engine import EngineFactory
+
         return EngineFactory.create_engine(self.config, async_mode)
 
     def _initialize_sync(self) -> None:
@@ -87,7 +101,14 @@ class Database:
         if self._is_sync_initialized:
             return
         try:
-            self._sync_engine = self._create_engine()
+            from sqlalchemy.orm import sessionmaker
+
+            engine = Database._sync_engines.get(self.config)
+            if engine is None:
+                engine = self._create_engine()
+                Database._sync_engines[self.config] = engine
+
+            self._sync_engine = engine
             self._sync_session_factory = sessionmaker(
                 bind=self._sync_engine,
                 autocommit=False,
@@ -104,10 +125,17 @@ class Database:
         if self._is_async_initialized:
             return
         try:
+            from sqlalchemy.ext.asyncio import async_sessionmaker
+
             if not self.config.enable_async:
                 raise ValueError("Async support is not enabled in configuration.")
 
-            self._async_engine = self._create_engine(async_mode=True)
+            engine = Database._async_engines.get(self.config)
+            if engine is None:
+                engine = self._create_engine(async_mode=True)
+                Database._async_engines[self.config] = engine
+
+            self._async_engine = engine
             self._async_session_factory = async_sessionmaker(
                 bind=self._async_engine,
                 autocommit=False,
@@ -123,26 +151,27 @@ class Database:
         """Log an error and raise a DatabaseError."""
         error_details = format_error_details(exception)
         self._logger.error(f"{message}: {error_details}")
-        raise DatabaseError(details=error_details) from exception
+        raise DatabaseError(details=error_details, log=False) from exception
 
     @property
     def engine(self) -> Engine:
         """Get the synchronous SQLAlchemy engine instance."""
-        if self._sync_engine is None:
+        if not self._is_sync_initialized:
             self._initialize_sync()
         return self._sync_engine
 
     @property
     def async_engine(self) -> AsyncEngine:
         """Get the asynchronous SQLAlchemy engine instance."""
-        if self._async_engine is None:
+        if not self._is_async_initialized:
             self._initialize_async()
         return self._async_engine
 
     @contextmanager
     def get_db(self) -> Generator["Session", None, None]:
         """Synchronous database session context manager."""
-        self._initialize_sync()
+        if not self._is_sync_initialized:
+            self._initialize_sync()
         session = self._sync_session_factory()
         try:
             yield session
@@ -156,7 +185,8 @@ class Database:
     @asynccontextmanager
     async def get_async_db(self) -> AsyncGenerator["AsyncSession", None]:
         """Asynchronous database session context manager."""
-        self._initialize_async()
+        if not self._is_async_initialized:
+            self._initialize_async()
         async with self._async_session_factory() as session:
             try:
                 yield session
@@ -172,6 +202,7 @@ class Database:
         """
         try:
             if self._sync_engine:
+                Database._sync_engines.pop(self.config, None)
                 self._sync_engine.dispose()
                 self._sync_engine = None
                 self._sync_session_factory = None
@@ -187,6 +218,7 @@ class Database:
         """
         try:
             if self._async_engine:
+                Database._async_engines.pop(self.config, None)
                 await self._async_engine.dispose()
                 self._async_engine = None
                 self._async_session_factory = None
@@ -1,10 +1,12 @@
+import functools
 from abc import (
     ABC,
     abstractmethod,
 )
+from types import MappingProxyType
 from typing import (
     Dict,
-    Type,
+    Mapping,
     Union,
 )
 
@@ -16,6 +18,7 @@ from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     create_async_engine,
 )
+from sqlalchemy.pool import StaticPool
 
 from .config import (
     DatabaseConfig,
@@ -48,8 +51,15 @@ class DatabaseEngineFactory(ABC):
 
 class PostgresEngineFactory(DatabaseEngineFactory):
     def create_engine(self, config: DatabaseConfig, async_mode: bool) -> Union[Engine, AsyncEngine]:
+        engine_class = create_async_engine if async_mode else create_engine
+        return engine_class(self._get_url(config, async_mode), **self._build_kwargs(config))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _build_kwargs(config: DatabaseConfig) -> Mapping:
+        """Build engine kwargs once per config."""
         engine_kwargs = {
-            **self._get_base_kwargs(config),
+            **DatabaseEngineFactory._get_base_kwargs(config),
             "pool_size"   : config.pool_size,
             "max_overflow": config.max_overflow,
             "pool_timeout": config.pool_timeout,
@@ -57,10 +67,9 @@ class PostgresEngineFactory(DatabaseEngineFactory):
         }
 
         if config.ssl and config.ssl.enabled:
-            engine_kwargs["connect_args"] = self._get_ssl_args(config.ssl)
+            engine_kwargs["connect_args"] = PostgresEngineFactory._get_ssl_args(config.ssl)
 
-        engine_class = create_async_engine if async_mode else create_engine
-        return engine_class(self._get_url(config, async_mode), **engine_kwargs)
+        return MappingProxyType(engine_kwargs)
 
     @staticmethod
     def _get_ssl_args(ssl_config: SSLConfig) -> dict:
@@ -75,8 +84,15 @@ class PostgresEngineFactory(DatabaseEngineFactory):
 
 class MySQLEngineFactory(DatabaseEngineFactory):
     def create_engine(self, config: DatabaseConfig, async_mode: bool) -> Union[Engine, AsyncEngine]:
+        engine_class = create_async_engine if async_mode else create_engine
+        return engine_class(self._get_url(config, async_mode), **self._build_kwargs(config))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _build_kwargs(config: DatabaseConfig) -> Mapping:
+        """Build engine kwargs once per config."""
         engine_kwargs = {
-            **self._get_base_kwargs(config),
+            **DatabaseEngineFactory._get_base_kwargs(config),
             "pool_size"   : config.pool_size,
             "max_overflow": config.max_overflow,
             "pool_timeout": config.pool_timeout,
@@ -88,13 +104,12 @@ class MySQLEngineFactory(DatabaseEngineFactory):
             connect_args["charset"] = config.charset
 
         if config.ssl and config.ssl.enabled:
-            connect_args.update(self._get_ssl_args(config.ssl))
+            connect_args.update(MySQLEngineFactory._get_ssl_args(config.ssl))
 
         if connect_args:
             engine_kwargs["connect_args"] = connect_args
 
-        engine_class = create_async_engine if async_mode else create_engine
-        return engine_class(self._get_url(config, async_mode), **engine_kwargs)
+        return MappingProxyType(engine_kwargs)
 
     @staticmethod
     def _get_ssl_args(ssl_config: SSLConfig) -> dict:
@@ -112,32 +127,44 @@ class SQLiteEngineFactory(DatabaseEngineFactory):
         if async_mode:
             raise ValueError("SQLite does not support asynchronous mode")
 
+        engine_class = create_engine
+        return engine_class(self._get_url(config, False), **self._build_kwargs(config))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _build_kwargs(config: DatabaseConfig) -> Mapping:
+        """Build engine kwargs once per config."""
         engine_kwargs = {
-            **self._get_base_kwargs(config),
+            **DatabaseEngineFactory._get_base_kwargs(config),
             "connect_args": {
                 "check_same_thread": False
-            }
+            },
         }
 
-        engine_class = create_engine
-        return engine_class(self._get_url(config, False), **engine_kwargs)
+        # An in-memory database lives and dies with its connection, so the
+        # engine must hold exactly one; StaticPool keeps that connection
+        # alive (and the data with it) across checkouts.
+        if config.database == ":memory:":
+            engine_kwargs["poolclass"] = StaticPool
+
+        return MappingProxyType(engine_kwargs)
 
 
 class EngineFactory:
     """Factory for creating database engines based on database type."""
 
-    _factories: Dict[DatabaseType, Type[DatabaseEngineFactory]] = {
-        DatabaseType.POSTGRESQL: PostgresEngineFactory,
-        DatabaseType.MYSQL     : MySQLEngineFactory,
-        DatabaseType.MARIADB   : MySQLEngineFactory,
-        DatabaseType.SQLITE    : SQLiteEngineFactory,
+    _factories: Dict[DatabaseType, DatabaseEngineFactory] = {
+        DatabaseType.POSTGRESQL: PostgresEngineFactory(),
+        DatabaseType.MYSQL     : MySQLEngineFactory(),
+        DatabaseType.MARIADB   : MySQLEngineFactory(),
+        DatabaseType.SQLITE    : SQLiteEngineFactory(),
     }
 
     @classmethod
     def create_engine(cls, config: DatabaseConfig, async_mode: bool = False) -> Union[Engine, AsyncEngine]:
         """Create a database engine based on configuration."""
-        factory_class = cls._factories.get(config.type)
-        if not factory_class:
+        factory = cls._factories.get(config.type)
+        if not factory:
             raise ValueError(f"Unsupported database type: {config.type}")
 
-        return factory_class().create_engine(config, async_mode)
+        return factory.create_engine(config, async_mode)
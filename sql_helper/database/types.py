@@ -11,27 +11,18 @@ class DatabaseType(Enum):
     @property
     def sync_driver(self) -> str:
         """Get a sync driver for a database type"""
-        drivers = {
-            DatabaseType.POSTGRESQL: "postgresql+psycopg",
-            DatabaseType.MYSQL     : "mysql+pymysql",
-            DatabaseType.MARIADB   : "mysql+pymysql",
-            DatabaseType.SQLITE    : "sqlite",
-        }
-        if self not in drivers:
+        driver = _SYNC_DRIVERS.get(self)
+        if driver is None:
             raise ValueError(f"No sync driver available for {self.value}")
-        return drivers[self]
+        return driver
 
     @property
     def async_driver(self) -> str:
         """Get an async driver for a database type"""
-        drivers = {
-            DatabaseType.POSTGRESQL: "postgresql+psycopg",
-            DatabaseType.MYSQL     : "mysql+aiomysql",
-            DatabaseType.MARIADB   : "mysql+aiomysql",
-        }
-        if self not in drivers:
+        driver = _ASYNC_DRIVERS.get(self)
+        if driver is None:
             raise ValueError(f"No async driver available for {self.value}")
-        return drivers[self]
+        return driver
 
     @property
     def supports_async(self) -> bool:
@@ -41,7 +32,7 @@ class DatabaseType(Enum):
     @property
     def supports_charset(self) -> bool:
         """Check if a database type supports charset"""
-        return self not in {DatabaseType.SQLITE, DatabaseType.POSTGRESQL}
+        return self in _CHARSET_SUPPORTED
 
     @property
     def requires_host(self) -> bool:
@@ -52,3 +43,21 @@ class DatabaseType(Enum):
     def requires_auth(self) -> bool:
         """Check if a database type requires authentication"""
         return self != DatabaseType.SQLITE
+
+
+# Lookup tables built once at import so the properties above avoid
+# rebuilding dict/set literals on every access.
+_SYNC_DRIVERS: dict[DatabaseType, str] = {
+    DatabaseType.POSTGRESQL: "postgresql+psycopg",
+    DatabaseType.MYSQL     : "mysql+pymysql",
+    DatabaseType.MARIADB   : "mysql+pymysql",
+    DatabaseType.SQLITE    : "sqlite",
+}
+
+_ASYNC_DRIVERS: dict[DatabaseType, str] = {
+    DatabaseType.POSTGRESQL: "postgresql+psycopg",
+    DatabaseType.MYSQL     : "mysql+aiomysql",
+    DatabaseType.MARIADB   : "mysql+aiomysql",
+}
+
+_CHARSET_SUPPORTED = frozenset({DatabaseType.MYSQL, DatabaseType.MARIADB})
@@ -1,3 +1,4 @@
+import functools
 from typing import (
     List,
     TYPE_CHECKING,
@@ -8,55 +9,57 @@ if TYPE_CHECKING:
     from .config import DatabaseConfigProtocol
 
 
+def _maybe_quote(value: str) -> str:
+    """Percent-encode only when needed.
+
+    Typical usernames, passwords and charset names are plain ASCII
+    alphanumerics (plus ``_``/``-``, which quote_plus leaves untouched),
+    so the scan-and-allocate in quote_plus can usually be skipped.
+    """
+    if value.isascii() and value.replace("_", "").replace("-", "").isalnum():
+        return value
+    return quote_plus(value)
+
+
 class DatabaseConfigValidator:
     """Validator for database configuration."""
 
     @staticmethod
     def validate(config: 'DatabaseConfigProtocol') -> None:
-        """Validate database configuration."""
-        DatabaseConfigValidator._validate_charset(config)
-        DatabaseConfigValidator._validate_credentials(config)
-        DatabaseConfigValidator._validate_async_support(config)
-        DatabaseConfigValidator._validate_port(config)
-        DatabaseConfigValidator._validate_database(config)
+        """Validate database configuration.
+
+        Runs as a single pass with the type bound once; the checks that
+        only apply to host-based databases live in _validate_network.
+        """
+        cfg_type = config.type
+
+        if config.charset and not cfg_type.supports_charset:
+            raise ValueError(f"{cfg_type.value} does not support charset")
+        if config.enable_async and not cfg_type.supports_async:
+            raise ValueError(f"{cfg_type.value} does not support async operations")
+        if cfg_type.requires_host:
+            DatabaseConfigValidator._validate_network(config)
+        if not config.database:
+            raise ValueError("Database name cannot be empty")
         DatabaseConfigValidator._validate_pool_settings(config)
 
     @staticmethod
-    def _validate_charset(config: 'DatabaseConfigProtocol') -> None:
-        """Validate database charset."""
-        if config.charset and not config.type.supports_charset:
-            raise ValueError(f"{config.type.value} does not support charset")
-
-    @staticmethod
-    def _validate_credentials(config: 'DatabaseConfigProtocol') -> None:
-        """Validate database credentials."""
-        if config.type.requires_auth:
-            if not config.credentials:
-                raise ValueError(f"{config.type.value} requires credentials")
-            if not config.credentials.username or not config.credentials.password:
+    def _validate_network(config: 'DatabaseConfigProtocol') -> None:
+        """Validate credentials and port for host-based databases."""
+        cfg_type = config.type
+        credentials = config.credentials
+
+        if cfg_type.requires_auth:
+            if not credentials:
+                raise ValueError(f"{cfg_type.value} requires credentials")
+            if not credentials.username or not credentials.password:
                 raise ValueError("Both username and password must be provided")
-
-    @staticmethod
-    def _validate_async_support(config: 'DatabaseConfigProtocol') -> None:
-        """Validate async support."""
-        if config.enable_async and not config.type.supports_async:
-            raise ValueError(f"{config.type.value} does not support async operations")
-
-    @staticmethod
-    def _validate_port(config: 'DatabaseConfigProtocol') -> None:
-        """Validate port number."""
-        if config.type.requires_host and not (0 <= config.port <= 65535):
+        if not (0 <= config.port <= 65535):
             raise ValueError(f"Invalid port number: {config.port}")
 
-    @staticmethod
-    def _validate_database(config: 'DatabaseConfigProtocol') -> None:
-        """Validate database name."""
-        if not config.database:
-            raise ValueError("Database name cannot be empty")
-
     @staticmethod
     def _validate_pool_settings(config: 'DatabaseConfigProtocol') -> None:
-        """Validate connection pool settings."""
+        """Validate connection-pool sizing options."""
         if config.pool_size < 1:
             raise ValueError("Pool size must be at least 1")
         if config.max_overflow < 0:
@@ -73,27 +76,40 @@ class DatabaseURLBuilder:
     @staticmethod
     def build_url(config: 'DatabaseConfigProtocol', async_mode: bool = False) -> str:
         """Build database URL based on configuration."""
+        return _build_url_cached(config, async_mode)
+
+    @staticmethod
+    def _build_url(config: 'DatabaseConfigProtocol', async_mode: bool) -> str:
+        """Assemble the URL; called once per (config, async_mode)."""
         if async_mode and not config.type.supports_async:
             raise ValueError(f"{config.type.value} does not support async operations")
 
-        if config.type.value == "sqlite":
-            return f"sqlite:///{config.database}"
+        template = _URL_TEMPLATES.get(config.type.value)
+        if template is not None:
+            return template.format_map({"database": config.database})
 
         driver = config.type.async_driver if async_mode else config.type.sync_driver
-        auth = DatabaseURLBuilder._build_auth_string(config)
         params = DatabaseURLBuilder._build_query_params(config)
-        query_string = "?" + "&".join(params) if params else ""
 
-        return f"{driver}://{auth}{config.host}:{config.port}/{config.database}{query_string}"
+        return _GENERIC_URL_TEMPLATE.format_map(
+            {
+                "driver"  : driver,
+                "auth"    : DatabaseURLBuilder._build_auth_string(config),
+                "host"    : config.host,
+                "port"    : config.port,
+                "database": config.database,
+                "qs"      : "?" + "&".join(params) if params else "",
+            }
+        )
 
     @staticmethod
     def _build_query_params(config: 'DatabaseConfigProtocol') -> List[str]:
         """Build query parameters for database URL."""
         params = []
         if config.charset and config.type.supports_charset:
-            params.append(f"charset={quote_plus(config.charset)}")
+            params.append(f"charset={_maybe_quote(config.charset)}")
         if config.schema and config.type.value == "postgresql":
-            params.append(f"options=-c%20search_path={quote_plus(config.schema)}")
+            params.append(f"options=-c%20search_path={_maybe_quote(config.schema)}")
         return params
 
     @staticmethod
@@ -101,4 +117,20 @@ class DatabaseURLBuilder:
         """Build authentication string for database URL."""
         if not config.credentials or not config.type.requires_auth:
             return ""
-        return f"{quote_plus(config.credentials.username)}:{quote_plus(config.credentials.password)}@"
+        return f"{_maybe_quote(config.credentials.username)}:{_maybe_quote(config.credentials.password)}@"
+
+
+# URL layouts prebuilt once; types with a dedicated template (sqlite has
+# no host/auth/driver parts) skip the generic assembly entirely.
+_GENERIC_URL_TEMPLATE = "{driver}://{auth}{host}:{port}/{database}{qs}"
+
+_URL_TEMPLATES: dict[str, str] = {
+    "sqlite": "sqlite:///{database}",
+}
+
+
+# URLs are deterministic per config, so repeated builds for the same
+# frozen config become a cache lookup instead of re-encoding credentials.
+@functools.lru_cache(maxsize=128)
+def _build_url_cached(config: 'DatabaseConfigProtocol', async_mode: bool) -> str:
+    return DatabaseURLBuilder._build_url(config, async_mode)
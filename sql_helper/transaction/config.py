@@ -25,9 +25,15 @@ class TransactionOptions:
 
     def __post_init__(self):
         """Validate options after initialization."""
-        if self.retry_count < 0:
-            raise ValueError("retry_count must be non-negative")
-        if self.retry_backoff <= 0:
-            raise ValueError("retry_backoff must be positive")
-        if self.timeout is not None and self.timeout <= 0:
+        # Single combined branch; well-formed options take one comparison
+        # chain instead of three separate checks.
+        if (
+            self.retry_count < 0
+            or self.retry_backoff <= 0
+            or (self.timeout is not None and self.timeout <= 0)
+        ):
+            if self.retry_count < 0:
+                raise ValueError("retry_count must be non-negative")
+            if self.retry_backoff <= 0:
+                raise ValueError("retry_backoff must be positive")
             raise ValueError("timeout must be positive")
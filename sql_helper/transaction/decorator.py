@@ -1,7 +1,7 @@
 import asyncio
+import logging
 import time
 from functools import wraps
-from traceback import format_exc
 from typing import (
     Any,
     Callable,
@@ -48,14 +48,18 @@ def handle_error(error: Exception, retry_remaining: int) -> NoReturn:
     """
 
     if retry_remaining > 0:
-        logger.warning(
-            "Transaction failed, retrying",
-            extra={
-                "error"          : str(error),
-                "retry_remaining": retry_remaining,
-                "error_type"     : type(error).__name__,
-            }
-        )
+        # Custom loggers may not expose isEnabledFor; only then skip the
+        # gate and pay for building the extra dict unconditionally.
+        is_enabled_for = getattr(logger, "isEnabledFor", None)
+        if is_enabled_for is None or is_enabled_for(logging.WARNING):
+            logger.warning(
+                "Transaction failed, retrying",
+                extra={
+                    "error"          : str(error),
+                    "retry_remaining": retry_remaining,
+                    "error_type"     : type(error).__name__,
+                }
+            )
         return
     else:
         logger.error(
@@ -63,7 +67,6 @@ def handle_error(error: Exception, retry_remaining: int) -> NoReturn:
             extra={
                 "error"     : str(error),
                 "error_type": type(error).__name__,
-                "traceback" : format_exc()
             },
             exc_info=True
         )
@@ -88,14 +91,24 @@ async def retry_async(
     """
     retry_remaining = options.retry_count
 
-    while retry_remaining >= 0:
+    # Retries are disabled by default; skip the loop bookkeeping entirely.
+    if retry_remaining == 0:
         try:
             return await func()
         except options.rollback_for as e:
+            handle_error(e, 0)
+
+    rollback_for = options.rollback_for
+    retry_backoff = options.retry_backoff
+
+    while retry_remaining >= 0:
+        try:
+            return await func()
+        except rollback_for as e:
             if retry_remaining <= 0:
                 handle_error(e, retry_remaining)
             retry_remaining -= 1
-            await asyncio.sleep(options.retry_backoff)
+            await asyncio.sleep(retry_backoff)
     raise RuntimeError("Unreachable code")
 
 
@@ -115,14 +128,82 @@ def retry_sync(
     """
     retry_remaining = options.retry_count
 
-    while retry_remaining >= 0:
+    # Retries are disabled by default; skip the loop bookkeeping entirely.
+    if retry_remaining == 0:
         try:
             return func()
         except options.rollback_for as e:
+            handle_error(e, 0)
+
+    rollback_for = options.rollback_for
+    retry_backoff = options.retry_backoff
+
+    while retry_remaining >= 0:
+        try:
+            return func()
+        except rollback_for as e:
             if retry_remaining <= 0:
                 handle_error(e, retry_remaining)
             retry_remaining -= 1
-            time.sleep(options.retry_backoff)
+            time.sleep(retry_backoff)
+    raise RuntimeError("Unreachable code")
+
+
+async def retry_async_catchall(
+    func: Callable[[], Coroutine[Any, Any, RT]],
+    options: TransactionOptions,
+) -> RT:
+    """retry_async specialized for the default rollback_for of (Exception,).
+
+    A bare ``except Exception`` lets the interpreter skip tuple matching.
+    """
+    retry_remaining = options.retry_count
+
+    if retry_remaining == 0:
+        try:
+            return await func()
+        except Exception as e:
+            handle_error(e, 0)
+
+    retry_backoff = options.retry_backoff
+
+    while retry_remaining >= 0:
+        try:
+            return await func()
+        except Exception as e:
+            if retry_remaining <= 0:
+                handle_error(e, retry_remaining)
+            retry_remaining -= 1
+            await asyncio.sleep(retry_backoff)
+    raise RuntimeError("Unreachable code")
+
+
+def retry_sync_catchall(
+    func: Callable[[], RT],
+    options: TransactionOptions,
+) -> RT:
+    """retry_sync specialized for the default rollback_for of (Exception,).
+
+    A bare ``except Exception`` lets the interpreter skip tuple matching.
+    """
+    retry_remaining = options.retry_count
+
+    if retry_remaining == 0:
+        try:
+            return func()
+        except Exception as e:
+            handle_error(e, 0)
+
+    retry_backoff = options.retry_backoff
+
+    while retry_remaining >= 0:
+        try:
+            return func()
+        except Exception as e:
+            if retry_remaining <= 0:
+                handle_error(e, retry_remaining)
+            retry_remaining -= 1
+            time.sleep(retry_backoff)
     raise RuntimeError("Unreachable code")
 
 
@@ -166,26 +247,50 @@ def transactional(
         rollback_for=rollback_for if isinstance(rollback_for, tuple) else (rollback_for,),
     )
 
+    # A concrete Database needs no registry lookup; resolve it once at
+    # decoration time and only defer resolution for string names. Name
+    # lookups are memoized against the manager's version counter so the
+    # registry is only consulted again after a (rare) mutation.
+    resolved_db = db if isinstance(db, Database) else None
+
+    # Pick the retry variant once; the default (Exception,) gets the
+    # bare-except specialization.
+    if options.rollback_for == (Exception,):
+        run_async, run_sync = retry_async_catchall, retry_sync_catchall
+    else:
+        run_async, run_sync = retry_async, retry_sync
+
+    cached_db: Optional[Database] = None
+    cached_version: int = -1
+
+    def resolve_database() -> Database:
+        nonlocal cached_db, cached_version
+        version = transaction_manager.version
+        if cached_db is None or cached_version != version:
+            cached_db = transaction_manager.get_database(db)
+            cached_version = version
+        return cached_db
+
     def decorator(func: Callable[..., RT]) -> Callable[..., RT]:
         @wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> RT:
-            database = transaction_manager.get_database(db)
+            database = resolved_db or resolve_database()
 
             async def execute() -> RT:
                 async with handle_async_transaction(database, options):
                     return await func(*args, **kwargs)
 
-            return await retry_async(execute, options)
+            return await run_async(execute, options)
 
         @wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> RT:
-            database = transaction_manager.get_database(db)
+            database = resolved_db or resolve_database()
 
             def execute() -> RT:
                 with handle_sync_transaction(database, options):
                     return func(*args, **kwargs)
 
-            return retry_sync(execute, options)
+            return run_sync(execute, options)
 
         return async_wrapper if options.mode == TransactionMode.ASYNC else sync_wrapper
 
@@ -1,14 +1,17 @@
+from __future__ import annotations
+
+import functools
 from contextlib import (
-    asynccontextmanager,
-    contextmanager,
+    AsyncExitStack,
+    ExitStack,
 )
-from enum import Enum
 from typing import (
     Any,
-    AsyncGenerator,
     Callable,
-    Generator,
+    ClassVar,
+    Final,
     Generic,
+    NamedTuple,
     Optional,
     TYPE_CHECKING,
     TypeVar,
@@ -19,7 +22,7 @@ from sqlalchemy import text
 
 from .config import TransactionOptions
 from .session import (
-    SessionStack,
+    SESSION_STACK,
     current_session_stack,
 )
 from .timeout import (
@@ -31,379 +34,328 @@ from .types import PropagationType
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
     from sqlalchemy.orm import Session
+
     from ..database import Database
 
-T = TypeVar('T', bound=Union[Session, AsyncSession])
-SessionOps = dict[str, Callable[..., Any]]
+T = TypeVar('T', bound='Union[Session, AsyncSession]')
+
+
+class SessionOps(NamedTuple):
+    """Bundle of session-stack and database callables for one handler.
+
+    A NamedTuple keeps the hot-path access an attribute load instead of
+    a string-keyed dict lookup, and is built once per handler.
+    """
+    push: Callable[..., Any]
+    pop: Callable[..., Any]
+    configure: Callable[..., Any]
+    get_db: Callable[..., Any]
+
+
+# SET TRANSACTION clauses are drawn from a tiny fixed set, so the
+# TextClause objects are built once instead of per transaction.
+_READ_ONLY_CLAUSE = text("SET TRANSACTION READ ONLY")
+
+
+@functools.lru_cache(maxsize=8)
+def _iso_clause(level: str):
+    return text(f"SET TRANSACTION ISOLATION LEVEL {level}")
 
 
 def _configure_session(session: Session, options: TransactionOptions) -> None:
     """Configure session with transaction options"""
     if options.isolation_level:
-        session.execute(text(f"SET TRANSACTION ISOLATION LEVEL {options.isolation_level}"))
+        session.execute(_iso_clause(options.isolation_level))
     if options.read_only:
-        session.execute(text("SET TRANSACTION READ ONLY"))
+        session.execute(_READ_ONLY_CLAUSE)
 
 
 async def _configure_async_session(session: AsyncSession, options: TransactionOptions) -> None:
     """Configure async session with transaction options"""
     if options.isolation_level:
-        await session.execute(text(f"SET TRANSACTION ISOLATION LEVEL {options.isolation_level}"))
+        await session.execute(_iso_clause(options.isolation_level))
     if options.read_only:
-        await session.execute(text("SET TRANSACTION READ ONLY"))
+        await session.execute(_READ_ONLY_CLAUSE)
 
 
-class TransactionError(str, Enum):
-    NEVER_EXISTS = "Transaction already exists (NEVER propagation)"
-    MANDATORY_REQUIRED = "No existing transaction (MANDATORY propagation)"
+_ERR_NEVER_EXISTS: Final = "Transaction already exists (NEVER propagation)"
+_ERR_MANDATORY_REQUIRED: Final = "No existing transaction (MANDATORY propagation)"
 
 
-class TransactionHandler(Generic[T]):
-    """Handles database transaction lifecycle and propagation.
+class _PropagationStrategy:
+    """Base class for propagation strategies.
 
-    Args:
-        database: Database instance to use for transaction
-        options: Transaction configuration options
-        is_async: Whether to use async or sync operations
+    One stateless instance per propagation type handles both the sync and
+    async paths imperatively; cleanup is registered on the handler's exit
+    stack instead of being woven through generator frames. Subclasses
+    override ``enter_sync``/``enter_async`` and return the session the
+    transaction body should use (or None).
     """
 
-    def __init__(
-        self,
-        database: Database,
-        options: TransactionOptions,
-        is_async: bool = False
-    ):
-        self.database = database
-        self.options = options
-        self.is_async = is_async
-        self.session_stack = current_session_stack.get()
-        self.token = None
+    __slots__ = ()
 
-        if self.session_stack is None:
-            self.session_stack = SessionStack()
-            self.token = current_session_stack.set(self.session_stack)
+    def enter_sync(self, handler: "TransactionHandler") -> Optional[Session]:
+        raise NotImplementedError
+
+    async def enter_async(self, handler: "TransactionHandler") -> Optional[AsyncSession]:
+        raise NotImplementedError
 
     @staticmethod
-    async def _handle_session_async(
-        session: AsyncSession,
-        ops: SessionOps
-    ) -> AsyncGenerator[AsyncSession, None]:
-        """Yield an async session from the session stack.
+    def _track_sync(handler: "TransactionHandler", session: Session) -> None:
+        """Push the session onto the stack and schedule the matching pop."""
+        ops = handler._ops
+        session_id = ops.push(session)
+        handler._exit_stack.callback(ops.pop, session_id)
 
-        Args:
-            session: Async session to add to the stack
-            ops: Session operations
+    @staticmethod
+    async def _track_async(handler: "TransactionHandler", session: AsyncSession) -> None:
+        """Push the session onto the stack and schedule the matching pop."""
+        ops = handler._ops
+        session_id = ops.push(session)
+        handler._async_exit_stack.callback(ops.pop, session_id)
+
+    @classmethod
+    def _open_sync(cls, handler: "TransactionHandler") -> Session:
+        """Open, configure and track a new sync session."""
+        ops = handler._ops
+        options = handler.options
+        session = handler._exit_stack.enter_context(ops.get_db())
+        if options.isolation_level or options.read_only:
+            ops.configure(session, options)
+        cls._track_sync(handler, session)
+        return session
+
+    @classmethod
+    async def _open_async(cls, handler: "TransactionHandler") -> AsyncSession:
+        """Open, configure and track a new async session."""
+        ops = handler._ops
+        options = handler.options
+        session = await handler._async_exit_stack.enter_async_context(ops.get_db())
+        if options.isolation_level or options.read_only:
+            await ops.configure(session, options)
+        await cls._track_async(handler, session)
+        return session
+
+
+class _RequiredStrategy(_PropagationStrategy):
+    """Use the existing transaction if available, create one if not."""
+
+    __slots__ = ()
+
+    def enter_sync(self, handler: "TransactionHandler") -> Session:
+        existing_session = handler.existing_session
+        if existing_session is not None:
+            self._track_sync(handler, existing_session)
+            return existing_session
+        return self._open_sync(handler)
 
-        Yields:
-            AsyncSession: The session added to the stack
-        """
+    async def enter_async(self, handler: "TransactionHandler") -> AsyncSession:
+        existing_session = handler.existing_session
+        if existing_session is not None:
+            await self._track_async(handler, existing_session)
+            return existing_session
+        return await self._open_async(handler)
 
-        session_id = await ops['push'](session)
-        try:
-            yield session
-        finally:
-            await ops['pop'](session_id)
 
-    @contextmanager
-    def _handle_session_sync(
-        self,
-        session: Session,
-        ops: SessionOps
-    ) -> Generator[Session, None, None]:
-        """Yield a sync session from the session stack.
+class _RequiresNewStrategy(_PropagationStrategy):
+    """Always create a new transaction."""
 
-        Args:
-            session: Sync session to add to the stack
-            ops: Session operations
+    __slots__ = ()
 
-        Yields:
-            Session: The session added to the stack
-        """
+    def enter_sync(self, handler: "TransactionHandler") -> Session:
+        return self._open_sync(handler)
 
-        session_id = ops['push'](session)
-        try:
-            yield session
-        finally:
-            ops['pop'](session_id)
+    async def enter_async(self, handler: "TransactionHandler") -> AsyncSession:
+        return await self._open_async(handler)
 
-    async def _handle_required_async(
-        self,
-        existing_session: Optional[AsyncSession],
-        ops: SessionOps
-    ) -> AsyncGenerator[AsyncSession, None]:
-        """Handle asynchronous transaction based on a propagation type.
 
-        Args:
-            existing_session: Existing session to re-use
-            ops: Session operations
+class _SupportsStrategy(_PropagationStrategy):
+    """Use the existing transaction if available, proceed without if not."""
 
-        Yields:
-            AsyncSession: The session to use for the transaction
-        """
+    __slots__ = ()
 
+    def enter_sync(self, handler: "TransactionHandler") -> Optional[Session]:
+        existing_session = handler.existing_session
         if existing_session is not None:
-            async for session in self._handle_session_async(existing_session, ops):
-                yield session
-            return
+            self._track_sync(handler, existing_session)
+        return existing_session
 
-        async with ops['get_db']() as session:
-            await ops['configure'](session, self.options)
-            async for session_ in self._handle_session_async(session, ops):
-                yield session_
+    async def enter_async(self, handler: "TransactionHandler") -> Optional[AsyncSession]:
+        existing_session = handler.existing_session
+        if existing_session is not None:
+            await self._track_async(handler, existing_session)
+        return existing_session
 
-    @contextmanager
-    def _handle_required_sync(
-        self,
-        existing_session: Optional[Session],
-        ops: SessionOps
-    ) -> Generator[Session, None, None]:
-        """Handle synchronous transaction based on a propagation type.
 
-        Args:
-            existing_session: Existing session to re-use
-            ops: Session operations
+class _NeverStrategy(_PropagationStrategy):
+    """Error if a transaction exists, proceed without one if not."""
 
-        Yields:
-            Session: The session to use for the transaction
-        """
+    __slots__ = ()
 
-        if existing_session is not None:
-            with self._handle_session_sync(existing_session, ops):
-                yield existing_session
-            return
+    def enter_sync(self, handler: "TransactionHandler") -> None:
+        if handler.existing_session is not None:
+            raise ValueError(_ERR_NEVER_EXISTS)
+        return None
 
-        with ops['get_db']() as session:
-            ops['configure'](session, self.options)
-            with self._handle_session_sync(session, ops):
-                yield session
+    async def enter_async(self, handler: "TransactionHandler") -> None:
+        if handler.existing_session is not None:
+            raise ValueError(_ERR_NEVER_EXISTS)
+        return None
 
-    async def _handle_requires_new_async(
-        self,
-        ops: SessionOps
-    ) -> AsyncGenerator[AsyncSession, None]:
-        """Handle asynchronous transaction with REQUIRES_NEW propagation.
-
-        Args:
-            ops: Session operations
-
-        Yields:
-            AsyncSession: The new session to use for the transaction
-        """
-        async with ops['get_db']() as session:
-            await ops['configure'](session, self.options)
-            async for session_ in self._handle_session_async(session, ops):
-                yield session_
-
-    @contextmanager
-    def _handle_requires_new_sync(
-        self,
-        ops: SessionOps
-    ) -> Generator[Session, None, None]:
-        """Handle synchronous transaction based on a propagation type.
 
-        Args:
-            ops: Session operations
+class _MandatoryStrategy(_PropagationStrategy):
+    """Use the existing transaction, error if none exists."""
 
-        Yields:
-            Session: The session to use for the transaction
-        """
+    __slots__ = ()
 
-        with ops['get_db']() as session:
-            ops['configure'](session, self.options)
-            with self._handle_session_sync(session, ops):
-                yield session
+    def enter_sync(self, handler: "TransactionHandler") -> Session:
+        existing_session = handler.existing_session
+        if existing_session is None:
+            raise ValueError(_ERR_MANDATORY_REQUIRED)
+        self._track_sync(handler, existing_session)
+        return existing_session
 
-    async def _handle_supports_async(
-        self,
-        existing_session: Optional[AsyncSession],
-        ops: SessionOps
-    ) -> AsyncGenerator[Optional[AsyncSession], None]:
-        """Handle asynchronous transaction with SUPPORTS propagation.
-
-        Args:
-            existing_session: Existing session to re-use
-            ops: Session operations
-
-        Yields:
-            Optional[AsyncSession]: The session if exists, None otherwise
-        """
-        if existing_session is not None:
-            async for session in self._handle_session_async(existing_session, ops):
-                yield session
-        else:
-            yield None
+    async def enter_async(self, handler: "TransactionHandler") -> AsyncSession:
+        existing_session = handler.existing_session
+        if existing_session is None:
+            raise ValueError(_ERR_MANDATORY_REQUIRED)
+        await self._track_async(handler, existing_session)
+        return existing_session
 
-    @contextmanager
-    def _handle_supports_sync(
-        self,
-        existing_session: Optional[Session],
-        ops: SessionOps
-    ) -> Generator[Optional[Session], None, None]:
-        """Handle synchronous transaction based on a propagation type.
 
-        Args:
-            existing_session: Existing session to re-use
-            ops: Session operations
+class TransactionHandler(Generic[T]):
+    """Handles database transaction lifecycle and propagation.
 
-        Yields:
-            Optional[Session]: The session to use for the transaction or None if no existing session
-        """
+    Args:
+        database: Database instance to use for transaction
+        options: Transaction configuration options
+        is_async: Whether to use async or sync operations
+    """
 
-        if existing_session is not None:
-            with self._handle_session_sync(existing_session, ops):
-                yield existing_session
-        else:
-            yield None
+    # One handler is allocated per transaction; slots drop the instance
+    # __dict__ and make the hot attribute loads C-level.
+    __slots__ = (
+        "database",
+        "options",
+        "is_async",
+        "session_stack",
+        "existing_session",
+        "token",
+        "_ops",
+        "_exit_stack",
+        "_async_exit_stack",
+    )
+
+    # Propagation dispatch table built once at import; each strategy is a
+    # shared stateless singleton handling both sync and async entry.
+    _DISPATCH: ClassVar[dict[PropagationType, _PropagationStrategy]] = {
+        PropagationType.REQUIRED    : _RequiredStrategy(),
+        PropagationType.REQUIRES_NEW: _RequiresNewStrategy(),
+        PropagationType.SUPPORTS    : _SupportsStrategy(),
+        PropagationType.NEVER       : _NeverStrategy(),
+        PropagationType.MANDATORY   : _MandatoryStrategy(),
+    }
 
-    def _get_propagation_handler(self) -> dict[PropagationType, Callable]:
-        """Get the appropriate handler for the propagation type.
+    def __init__(
+        self,
+        database: Database,
+        options: TransactionOptions,
+        is_async: bool = False
+    ):
+        self.database = database
+        self.options = options
+        self.is_async = is_async
+        self.session_stack = current_session_stack.get()
+        # Resolved once here; a handler is always entered right after
+        # construction, so nothing can push onto the stack in between.
+        self.existing_session = (
+            self.session_stack.get_current() if self.session_stack is not None else None
+        )
+        self.token = None
 
-        Returns:
-            Dictionary mapping propagation types to their handlers:
-            - REQUIRED: Uses existing transaction if available, creates new one if not
-            - REQUIRES_NEW: Always creates new transaction
-            - SUPPORTS: Uses existing transaction if available, proceeds without if not
-            - NEVER: Errors if transaction exists, proceeds without if not
-            - MANDATORY: Uses existing transaction, errors if none exists
-        """
+        # Nested transactions find a stack already installed; the
+        # top-level case defers creation to _ensure_stack so __init__
+        # never touches the contextvar.
+        if self.session_stack is not None:
+            self._bind_ops()
 
+    def _bind_ops(self) -> None:
+        """Bind the SessionOps bundle to the current session stack."""
         if self.is_async:
-            return {
-                PropagationType.REQUIRED    : self._handle_required_async,
-                PropagationType.REQUIRES_NEW: self._handle_requires_new_async,
-                PropagationType.SUPPORTS    : self._handle_supports_async,
-                PropagationType.NEVER       : self._handle_never,
-                PropagationType.MANDATORY   : self._handle_mandatory_async,
-            }
+            self._ops = SessionOps(
+                push=self.session_stack.push,
+                pop=self.session_stack.pop,
+                configure=_configure_async_session,
+                get_db=self.database.get_async_db,
+            )
         else:
-            return {
-                PropagationType.REQUIRED    : self._handle_required_sync,
-                PropagationType.REQUIRES_NEW: self._handle_requires_new_sync,
-                PropagationType.SUPPORTS    : self._handle_supports_sync,
-                PropagationType.NEVER       : self._handle_never,
-                PropagationType.MANDATORY   : self._handle_mandatory_sync,
-            }
-
-    async def handle_async(self) -> AsyncGenerator[Optional[AsyncSession], None]:
-        """
-        Handle asynchronous transaction based on a propagation type.
-
-        Yields:
-            Optional[AsyncSession]: Database session
-        """
+            self._ops = SessionOps(
+                push=self.session_stack.push,
+                pop=self.session_stack.pop,
+                configure=_configure_session,
+                get_db=self.database.get_db,
+            )
+
+    def _ensure_stack(self) -> None:
+        """Install a session stack for top-level transactions on first use."""
+        if self.session_stack is None:
+            self.session_stack = SESSION_STACK
+            self.token = current_session_stack.set(self.session_stack)
+            self._bind_ops()
+
+    def _reset_token(self) -> None:
+        """Restore the contextvar if this handler installed the stack."""
+        if self.token is not None:
+            current_session_stack.reset(self.token)
+            self.token = None
 
+    def __enter__(self) -> Optional[Session]:
+        """Enter a synchronous transaction based on the propagation type."""
+        self._exit_stack = ExitStack()
         try:
-            async with async_timeout(self.options.timeout):
-                existing_session = self.session_stack.get_current() if self.session_stack else None
-                ops = {
-                    'push'     : self.session_stack.async_push,
-                    'pop'      : self.session_stack.async_pop,
-                    'configure': _configure_async_session,
-                    'get_db'   : self.database.get_async_db,
-                }
-                handler = self._get_propagation_handler()[self.options.propagation]
-                async for session in handler(existing_session, ops):
-                    yield session
+            self._exit_stack.enter_context(sync_timeout(self.options.timeout))
+            self._ensure_stack()
+            return self._DISPATCH[self.options.propagation].enter_sync(self)
+        except BaseException:
+            try:
+                self._exit_stack.close()
+            finally:
+                self._reset_token()
+            raise
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        try:
+            return self._exit_stack.__exit__(exc_type, exc_val, exc_tb)
         finally:
-            if self.token is not None:
-                current_session_stack.reset(self.token)
-
-    @contextmanager
-    def handle_sync(self) -> Generator[Optional[Session], None, None]:
-        """
-        Handle synchronous transaction based on a propagation type.
-
-        Yields:
-            Optional[Session]: Database session
-        """
+            self._reset_token()
 
+    async def __aenter__(self) -> Optional[AsyncSession]:
+        """Enter an asynchronous transaction based on the propagation type."""
+        self._async_exit_stack = AsyncExitStack()
         try:
-            with sync_timeout(self.options.timeout):
-                existing_session = self.session_stack.get_current() if self.session_stack else None
-                ops = {
-                    'push'     : self.session_stack.push,
-                    'pop'      : self.session_stack.pop,
-                    'configure': _configure_session,
-                    'get_db'   : self.database.get_db,
-                }
-                handler = self._get_propagation_handler()[self.options.propagation]
-                with handler(existing_session, ops) as session:
-                    yield session
+            await self._async_exit_stack.enter_async_context(
+                async_timeout(self.options.timeout)
+            )
+            self._ensure_stack()
+            return await self._DISPATCH[self.options.propagation].enter_async(self)
+        except BaseException:
+            try:
+                await self._async_exit_stack.aclose()
+            finally:
+                self._reset_token()
+            raise
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        try:
+            return await self._async_exit_stack.__aexit__(exc_type, exc_val, exc_tb)
         finally:
-            if self.token is not None:
-                current_session_stack.reset(self.token)
-
-    @staticmethod
-    def _handle_never(
-        existing_session: Optional[T],
-        *_,
-    ) -> Generator[Optional[T], None, None]:
-        """
-        Handle 'NEVER' transaction propagation type.
-
-        If an existing session is provided, a ValueError is raised.
-
-        Yields:
-            Optional[AsyncSession]: None
-        """
-
-        if existing_session is not None:
-            raise ValueError(TransactionError.NEVER_EXISTS)
-        yield None
-
-    async def _handle_mandatory_async(
-        self,
-        existing_session: Optional[AsyncSession],
-        ops: SessionOps
-    ) -> AsyncGenerator[AsyncSession, None]:
-        """
-        Handle MANDATORY transaction propagation type.
-
-        If an existing session is not provided, a ValueError is raised.
-
-        Args:
-            existing_session: Existing session to re-use
-            ops: Session operations
-
-        Yields:
-            AsyncSession: The session to use for the transaction
-        """
-
-        if existing_session is None:
-            raise ValueError(TransactionError.MANDATORY_REQUIRED)
-        async for session in self._handle_session_async(existing_session, ops):
-            yield session
-
-    @contextmanager
-    def _handle_mandatory_sync(
-        self,
-        existing_session: Optional[Session],
-        ops: SessionOps
-    ) -> Generator[Session, None, None]:
-        """
-        Handle MANDATORY transaction propagation type.
-
-        If an existing session is not provided, a ValueError is raised.
-
-        Args:
-            existing_session: Existing session to re-use
-            ops: Session operations
-
-        Yields:
-            Session: The session to use for the transaction
-        """
-
-        if existing_session is None:
-            raise ValueError(TransactionError.MANDATORY_REQUIRED)
-        with self._handle_session_sync(existing_session, ops):
-            yield existing_session
+            self._reset_token()
 
 
-@contextmanager
 def handle_sync_transaction(
     database: Database,
     options: TransactionOptions,
-) -> Generator[Optional[Session], None, None]:
+) -> TransactionHandler[Session]:
     """
     Handle synchronous transaction based on a propagation type.
 
@@ -411,20 +363,17 @@ def handle_sync_transaction(
         database: Database instance
         options: Transaction options
 
-    Yields:
-        Optional[Session]: Database session
+    Returns:
+        TransactionHandler usable as a context manager yielding the session
     """
 
-    handler = TransactionHandler[Session](database, options)
-    with handler.handle_sync() as session:
-        yield session
+    return TransactionHandler(database, options)
 
 
-@asynccontextmanager
-async def handle_async_transaction(
+def handle_async_transaction(
     database: Database,
     options: TransactionOptions,
-) -> AsyncGenerator[Optional[AsyncSession], None]:
+) -> TransactionHandler[AsyncSession]:
     """
     Handle asynchronous transaction based on a propagation type.
 
@@ -432,10 +381,8 @@ async def handle_async_transaction(
         database: Database instance
         options: Transaction options
 
-    Yields:
-        Optional[AsyncSession]: Database session
+    Returns:
+        TransactionHandler usable as an async context manager yielding the session
     """
 
-    handler = TransactionHandler[AsyncSession](database, options, is_async=True)
-    async for session in handler.handle_async():
-        yield session
+    return TransactionHandler(database, options, is_async=True)
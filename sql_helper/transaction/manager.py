@@ -8,14 +8,55 @@ from ..core import get_logger
 from ..database import Database
 
 
+class _NullLock:
+    """No-op lock substituted once a manager is frozen."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+_NULL_LOCK = _NullLock()
+
+
 class TransactionManager:
-    """Thread-safe transaction manager for database connections."""
+    """Thread-safe transaction manager for database connections.
+
+    Registrations are rare while lookups run on every transaction, so the
+    registry is copy-on-write: writers replace ``_databases`` wholesale
+    under the lock and readers access it without locking.
+    """
 
     def __init__(self):
         self._databases: Dict[str, Database] = {}
         self._lock = Lock()
+        self._frozen = False
+        self._version = 0
         self._logger = get_logger()
 
+    @property
+    def version(self) -> int:
+        """Registry change counter; bumps on every successful mutation.
+
+        Callers that memoize lookups compare this against the version they
+        cached under to know when to re-resolve.
+        """
+        return self._version
+
+    def freeze(self) -> None:
+        """
+        Mark the registration phase as complete.
+
+        Further registrations are rejected and the writer lock is swapped
+        for a no-op, so a frozen manager has zero synchronization cost.
+        Applications typically call this once after bootstrap.
+        """
+        self._frozen = True
+        self._lock = _NULL_LOCK
+        self._logger.info("Transaction manager frozen")
+
     def register_database(
         self,
         name: str,
@@ -31,10 +72,15 @@ class TransactionManager:
             database: Database instance
             override: Allow overriding existing registration
         """
+        if self._frozen:
+            raise RuntimeError("Transaction manager is frozen; cannot register databases")
         with self._lock:
             if name in self._databases and not override:
                 raise ValueError(f"Database '{name}' already registered")
-            self._databases[name] = database
+            databases = dict(self._databases)
+            databases[name] = database
+            self._databases = databases
+            self._version += 1
             self._logger.info(f"Database '{name}' registered successfully")
 
     def get_database(self, name: str) -> Database:
@@ -44,10 +90,10 @@ class TransactionManager:
         Raises:
             KeyError: If a database is not registered
         """
-        with self._lock:
-            if name not in self._databases:
-                raise KeyError(f"Database '{name}' not registered")
-            return self._databases[name]
+        database = self._databases.get(name)
+        if database is None:
+            raise KeyError(f"Database '{name}' not registered")
+        return database
 
     def unregister_database(self, name: str) -> Optional[Database]:
         """
@@ -57,7 +103,10 @@ class TransactionManager:
             The unregistered database instance or None
         """
         with self._lock:
-            if db := self._databases.pop(name, None):
+            databases = dict(self._databases)
+            if db := databases.pop(name, None):
+                self._databases = databases
+                self._version += 1
                 self._logger.info(f"Database '{name}' unregistered")
                 return db
             return None
@@ -65,7 +114,8 @@ class TransactionManager:
     def clear(self) -> None:
         """Remove all registered databases."""
         with self._lock:
-            self._databases.clear()
+            self._databases = {}
+            self._version += 1
             self._logger.info("All databases unregistered")
 
 
@@ -1,104 +1,53 @@
-import asyncio
 import contextvars
-from threading import Lock
 from typing import (
-    ClassVar,
-    Dict,
     Optional,
+    Tuple,
     Union,
 )
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+# Per-task session stack stored as an immutable tuple of
+# (session_id, session) pairs. Each asyncio task (and each thread) sees
+# its own copy-on-write value, so push/pop/get_current need no locking:
+# replacing the contextvar value is atomic and tasks never share state.
+_sessions: contextvars.ContextVar[Tuple] = contextvars.ContextVar(
+    'sql_helper_sessions', default=()
+)
+
 
 class SessionStack:
     """
     Manages multiple database sessions in a stack-like structure.
-    Thread-safe singleton implementation.
-    """
-    _instance: ClassVar[Optional['SessionStack']] = None
-    _init_lock: ClassVar[Lock] = Lock()
-
-    def __new__(cls) -> 'SessionStack':
-        with cls._init_lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._initialized = False
-            return cls._instance
-
-    def __init__(self) -> None:
-        with self._init_lock:
-            if getattr(self, '_initialized', False):
-                return
-
-            self.sessions: Dict[str, Union[Session, AsyncSession]] = {}
-            self._counter: int = 0
-            self._lock: Lock = Lock()
-            self._async_lock: asyncio.Lock = asyncio.Lock()
-            self._counter_lock: Lock = Lock()
-            self._initialized = True
-
-    def _get_next_session_id(self) -> str:
-        """
-        Thread-safe method to get next session ID.
 
-        Returns:
-            str: Unique session identifier
-        """
-        with self._counter_lock:
-            session_id = f"session_{self._counter}"
-            self._counter += 1
-            return session_id
+    State lives in a per-task ContextVar rather than instance attributes,
+    so concurrent tasks get isolated stacks and no mutex is required; the
+    class itself is stateless and callers share the module-level
+    ``SESSION_STACK`` instance.
+    """
 
-    def push(self, session: Union[Session, AsyncSession]) -> str:
+    def push(self, session: Union[Session, AsyncSession]) -> int:
         """
         Add a new session to the stack and return its ID.
-        Thread-safe implementation.
 
-        Args:
-            session: Database session to add
-
-        Returns:
-            str: Unique session identifier
-        """
-        session_id = self._get_next_session_id()
-        with self._lock:
-            self.sessions[session_id] = session
-            return session_id
-
-    async def async_push(self, session: Union[Session, AsyncSession]) -> str:
-        """
-        Asynchronously add a new session to the stack and return its ID.
+        The ID is ``id(session)``, unique for the object's lifetime, so no
+        counter (or formatted string key) is needed. Duplicate pushes of
+        the same session are fine: pops match LIFO.
 
         Args:
             session: Database session to add
 
         Returns:
-            str: Unique session identifier
+            int: Unique session identifier
         """
-        session_id = self._get_next_session_id()
-        async with self._async_lock:
-            self.sessions[session_id] = session
-            return session_id
+        session_id = id(session)
+        _sessions.set(_sessions.get() + ((session_id, session),))
+        return session_id
 
-    def pop(self, session_id: str) -> Optional[Union[Session, AsyncSession]]:
+    def pop(self, session_id: int) -> Optional[Union[Session, AsyncSession]]:
         """
         Remove and return a session by its ID.
-        Thread-safe implementation.
-
-        Args:
-            session_id: Session identifier to remove
-
-        Returns:
-            Optional[Session]: Removed session or None if not found
-        """
-        with self._lock:
-            return self.sessions.pop(session_id, None)
-
-    async def async_pop(self, session_id: str) -> Optional[Union[Session, AsyncSession]]:
-        """
-        Asynchronously remove and return a session by its ID.
 
         Args:
             session_id: Session identifier to remove
@@ -106,55 +55,38 @@ class SessionStack:
         Returns:
             Optional[Session]: Removed session or None if not found
         """
-        async with self._async_lock:
-            return self.sessions.pop(session_id, None)
+        stack = _sessions.get()
+        # Transactions unwind LIFO, so the match is normally at the top;
+        # popping there is a single slice with no concatenation.
+        if stack and stack[-1][0] == session_id:
+            _sessions.set(stack[:-1])
+            return stack[-1][1]
+        for index in range(len(stack) - 2, -1, -1):
+            if stack[index][0] == session_id:
+                _sessions.set(stack[:index] + stack[index + 1:])
+                return stack[index][1]
+        return None
 
     def get_current(self) -> Optional[Union[Session, AsyncSession]]:
         """
         Get the current active session.
-        Thread-safe implementation.
 
         Returns:
             Optional[Session]: Current session or None if no sessions exist
         """
-        with self._lock:
-            if not self.sessions:
-                return None
-                # Create a copy of values to avoid potential race conditions
-            sessions = list(self.sessions.values())
-            return sessions[-1] if sessions else None
-
-    async def async_get_current(self) -> Optional[Union[Session, AsyncSession]]:
-        """
-        Asynchronously get the current active session.
-
-        Returns:
-            Optional[Session]: Current session or None if no sessions exist
-        """
-        async with self._async_lock:
-            if not self.sessions:
-                return None
-                # Create a copy of values to avoid potential race conditions
-            sessions = list(self.sessions.values())
-            return sessions[-1] if sessions else None
+        stack = _sessions.get()
+        return stack[-1][1] if stack else None
 
     def clear(self) -> None:
         """
-        Clear all sessions from the stack.
-        Thread-safe implementation.
+        Clear all sessions from the stack for the current task.
         """
-        with self._lock:
-            self.sessions.clear()
-            self._counter = 0
+        _sessions.set(())
 
-    async def async_clear(self) -> None:
-        """
-        Asynchronously clear all sessions from the stack.
-        """
-        async with self._async_lock:
-            self.sessions.clear()
-            self._counter = 0
 
+# Shared stateless instance; the lock-and-__new__ singleton dance added
+# nothing once all state moved into the ContextVar above.
+SESSION_STACK = SessionStack()
 
 # Context variable for session stack management
 current_session_stack = contextvars.ContextVar('current_session_stack', default=None)
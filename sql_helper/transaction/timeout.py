@@ -1,5 +1,6 @@
 import asyncio
-import signal
+import ctypes
+import threading
 from contextlib import (
     asynccontextmanager,
     contextmanager,
@@ -7,38 +8,74 @@ from contextlib import (
 from typing import Optional
 
 
+def _raise_timeout_in_thread(thread_id: int) -> None:
+    """Raise TimeoutError asynchronously in the target thread."""
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_long(thread_id), ctypes.py_object(TimeoutError)
+    )
+
+
 @contextmanager
 def sync_timeout(seconds: Optional[float]):
-    """Timeout context manager for synchronous transactions."""
+    """Timeout context manager for synchronous transactions.
+
+    Uses a watchdog threading.Timer rather than SIGALRM, so it works off
+    the main thread and on Windows, keeps sub-second precision, and costs
+    no syscalls when the transaction finishes in time.
+    """
     if not seconds:
         yield
         return
 
-    def timeout_handler(*_):
-        raise TimeoutError("Transaction timeout")
-
-    original_handler = signal.signal(signal.SIGALRM, timeout_handler)
+    timer = threading.Timer(
+        seconds, _raise_timeout_in_thread, args=(threading.get_ident(),)
+    )
+    timer.daemon = True
+    timer.start()
     try:
-        signal.alarm(int(seconds))
         yield
     finally:
-        signal.alarm(0)
-        signal.signal(signal.SIGALRM, original_handler)
+        timer.cancel()
+
+
+# asyncio.timeout is 3.11+; resolved once so the hot path is a plain check.
+_asyncio_timeout = getattr(asyncio, "timeout", None)
 
 
 @asynccontextmanager
 async def async_timeout(seconds: Optional[float]):
-    """Timeout context manager for asynchronous transactions."""
+    """Timeout context manager for asynchronous transactions.
+
+    The previous implementation raised TimeoutError inside a background
+    task, so the protected block never saw it (and a Task leaked per
+    call). asyncio.timeout cancels the current task and re-raises as
+    TimeoutError at the await point; the pre-3.11 fallback does the same
+    with call_later plus task.cancel().
+    """
     if not seconds:
         yield
         return
 
-    async def timeout():
-        await asyncio.sleep(seconds)
-        raise TimeoutError("Transaction timeout")
+    if _asyncio_timeout is not None:
+        async with _asyncio_timeout(seconds):
+            yield
+        return
+
+    task = asyncio.current_task()
+    loop = asyncio.get_running_loop()
+    timed_out = False
 
-    task = asyncio.create_task(timeout())
+    def _expire() -> None:
+        nonlocal timed_out
+        timed_out = True
+        task.cancel()
+
+    handle = loop.call_later(seconds, _expire)
     try:
         yield
+    except asyncio.CancelledError:
+        if timed_out:
+            raise TimeoutError("Transaction timeout") from None
+        raise
     finally:
-        task.cancel()
+        handle.cancel()
@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import IntEnum
 from typing import (
     Type,
     TypeVar,
@@ -6,32 +6,40 @@ from typing import (
 )
 
 
-class TransactionMode(str, Enum):
+class TransactionMode(IntEnum):
     """Transaction modes."""
-    SYNC = "SYNC"
-    ASYNC = "ASYNC"
+    SYNC = 0
+    ASYNC = 1
 
 
-class PropagationType(str, Enum):
-    """Transaction propagation types."""
-    REQUIRED = "REQUIRED"  # Use existing transaction or create a new one
-    REQUIRES_NEW = "REQUIRES_NEW"  # Always create a new transaction
-    NESTED = "NESTED"  # Create a nested transaction
-    SUPPORTS = "SUPPORTS"  # Use existing transaction (do not create if none exists)
-    NOT_SUPPORTED = "NOT_SUPPORTED"  # Execute without a transaction
-    NEVER = "NEVER"  # Throw exception if a transaction exists
-    MANDATORY = "MANDATORY"  # Throw exception if no existing transaction
+class PropagationType(IntEnum):
+    """Transaction propagation types.
+
+    Members are small ints, so equality checks and dict dispatch hash on
+    the int fast path instead of comparing strings.
+    """
+    REQUIRED = 0  # Use existing transaction or create a new one
+    REQUIRES_NEW = 1  # Always create a new transaction
+    NESTED = 2  # Create a nested transaction
+    SUPPORTS = 3  # Use existing transaction (do not create if none exists)
+    NOT_SUPPORTED = 4  # Execute without a transaction
+    NEVER = 5  # Throw exception if a transaction exists
+    MANDATORY = 6  # Throw exception if no existing transaction
 
     @classmethod
     def validate(cls, value: Union[str, 'PropagationType']) -> 'PropagationType':
         """Validate and convert propagation type value."""
-        if isinstance(value, cls):
+        if type(value) is cls:
             return value
-        try:
-            return cls(value)
-        except ValueError:
+        member = _STR_TO_PROP.get(value)
+        if member is None:
             raise ValueError(f"Invalid propagation type: {value}")
+        return member
+
 
+# Name-to-member table built once; callers passing strings still resolve
+# with a single dict lookup and no Enum scan on the fast path.
+_STR_TO_PROP = {member.name: member for member in PropagationType}
 
 RT = TypeVar('RT')
 ExceptionTypes = Union[Type[Exception], tuple[Type[Exception], ...]]
@@ -1,4 +1,5 @@
 import logging
+import os
 from pathlib import Path
 
 import pytest
@@ -10,6 +11,16 @@ from tests.settings import (
 )
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _ensure_data_dir() -> None:
+    """Create the test data directory once per session.
+
+    Done here rather than at settings.py import so collection-only runs
+    and xdist workers importing settings don't each issue the syscall.
+    """
+    TEST_DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+
 @pytest.fixture(scope="session")
 def project_root() -> Path:
     """Return the project root directory."""
@@ -75,19 +86,26 @@ def pytest_configure(config):
 
 def pytest_collection_modifyitems(config, items):
     """Automatically add markers based on directory structure."""
+    # Precompute the prefix and marker objects once; per item this leaves
+    # a string slice plus startswith checks, with no Path construction.
+    tests_root = str(config.rootdir / "tests") + os.sep
+    prefix_len = len(tests_root)
+    unit_marker = pytest.mark.unit
+    integration_marker = pytest.mark.integration
+    database_marker = pytest.mark.database
+
     for item in items:
         # Get the relative path of the test file
-        test_path = Path(item.fspath).relative_to(config.rootdir / "tests")
-        test_path_str = str(test_path).replace("\\", "/")  # Ensure compatibility on Windows
+        test_path_str = item.fspath.strpath[prefix_len:].replace(os.sep, "/")
 
         # Add 'unit' marker for files under 'tests/unit'
         if test_path_str.startswith("unit/"):
-            item.add_marker(pytest.mark.unit)
+            item.add_marker(unit_marker)
 
         # Add 'integration' marker for files under 'tests/integration'
         elif test_path_str.startswith("integration/"):
-            item.add_marker(pytest.mark.integration)
+            item.add_marker(integration_marker)
 
         # Add 'database' marker for files in 'database' subdirectory
         if "database" in test_path_str:
-            item.add_marker(pytest.mark.database)
+            item.add_marker(database_marker)
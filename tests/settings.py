@@ -1,4 +1,3 @@
-import os
 from pathlib import Path
 
 # Project structure paths
@@ -28,6 +27,3 @@ LOGGING_CONFIG = {
     "datefmt"      : "%Y-%m-%d %H:%M:%S",
     "default_level": "CRITICAL"
 }
-
-# Ensure required directories exist
-os.makedirs(TEST_DATA_DIR, exist_ok=True)
@@ -16,7 +16,10 @@ from sql_helper import (
 
 
 ### Configuration Fixtures ###
-@pytest.fixture
+# Configs are frozen dataclasses with no per-test state, so one instance
+# per session is safe; tests derive variants via replace/update_config.
+# ssl_config stays function-scoped: it depends on per-test temp files.
+@pytest.fixture(scope="session")
 def sqlite_config() -> DatabaseConfig:
     """SQLite configuration (sync only)."""
     return DatabaseConfig(
@@ -26,7 +29,7 @@ def sqlite_config() -> DatabaseConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def postgres_config() -> DatabaseConfig:
     """PostgreSQL configuration."""
     return DatabaseConfig(
@@ -41,7 +44,7 @@ def postgres_config() -> DatabaseConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mysql_config() -> DatabaseConfig:
     """MySQL configuration."""
     return DatabaseConfig(
@@ -57,7 +60,7 @@ def mysql_config() -> DatabaseConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mariadb_config() -> DatabaseConfig:
     """MariaDB configuration."""
     return DatabaseConfig(
@@ -86,6 +89,12 @@ def ssl_config(ssl_temp_files) -> SSLConfig:
 
 
 ### Parameterized Database Fixture ###
+# sync_db/async_db stay function-scoped on purpose: the lifecycle tests
+# assert a freshly-constructed Database (engine is None before first use)
+# and call dispose themselves, so a shared instance would leak state
+# between tests. Engines here are lazy and most configs never connect,
+# so per-test construction is cheap; the integration suite is where the
+# session-scoped Database fixtures live.
 @pytest.fixture(
     params=[
         pytest.param("sqlite", id="sqlite-sync"),
@@ -123,7 +132,12 @@ def sync_db(
     try:
         yield db
     finally:
-        db.dispose_sync()
+        # Disposing an in-memory SQLite engine destroys the database and
+        # forces the next test to rebuild it; leave it to the shared
+        # engine pool (and process exit) instead. Networked engines are
+        # still disposed so no connections linger.
+        if db.config.type != DatabaseType.SQLITE:
+            db.dispose_sync()
 
 
 @pytest.fixture(
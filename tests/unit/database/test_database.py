@@ -8,14 +8,24 @@ class TestSyncDatabase:
 
     def test_engine_initialization(self, sync_db):
         """Test synchronous engine initialization."""
-        assert sync_db._sync_engine is None
-        assert not sync_db._is_sync_initialized
+        # Snapshot the lazy-init state in one tuple per phase.
+        state = (
+            sync_db._sync_engine,
+            sync_db._sync_session_factory,
+            sync_db._is_sync_initialized,
+        )
+        assert state == (None, None, False)
 
         _ = sync_db.engine
 
-        assert sync_db._is_sync_initialized
-        assert sync_db._sync_engine is not None
-        assert sync_db._sync_session_factory is not None
+        engine, factory, initialized = (
+            sync_db._sync_engine,
+            sync_db._sync_session_factory,
+            sync_db._is_sync_initialized,
+        )
+        assert initialized
+        assert engine is not None
+        assert factory is not None
 
     def test_session_factory_configuration(self, sync_db):
         """Test session factory configuration."""
@@ -30,15 +40,24 @@ class TestSyncDatabase:
         """Test complete session lifecycle including commit and close."""
         lifecycle_calls = []
 
+        # Wrap rather than replace so the real methods still run and
+        # SQLAlchemy's internal state stays consistent.
+        real_commit = Session.commit
+        real_close = Session.close
+
+        def tracked_commit(session_):
+            lifecycle_calls.append("commit")
+            return real_commit(session_)
+
+        def tracked_close(session_):
+            lifecycle_calls.append("close")
+            return real_close(session_)
+
         mock_commit = mocker.patch.object(
-            Session,
-            "commit",
-            side_effect=lambda: lifecycle_calls.append("commit"),
+            Session, "commit", autospec=True, side_effect=tracked_commit
         )
         mock_close = mocker.patch.object(
-            Session,
-            "close",
-            side_effect=lambda: lifecycle_calls.append("close"),
+            Session, "close", autospec=True, side_effect=tracked_close
         )
 
         with sync_db.get_db() as session:
@@ -54,8 +73,8 @@ class TestSyncDatabase:
 
     def test_session_error_handling(self, sync_db, mocker):
         """Test session error handling and rollback."""
-        mock_rollback = mocker.patch.object(Session, "rollback")
-        mock_close = mocker.patch.object(Session, "close")
+        mock_rollback = mocker.spy(Session, "rollback")
+        mock_close = mocker.spy(Session, "close")
 
         mocker.patch.object(
             sync_db,
@@ -80,9 +99,12 @@ class TestSyncDatabase:
 
         sync_db.dispose_sync()
 
-        assert sync_db._sync_engine is None
-        assert sync_db._sync_session_factory is None
-        assert not sync_db._is_sync_initialized
+        state = (
+            sync_db._sync_engine,
+            sync_db._sync_session_factory,
+            sync_db._is_sync_initialized,
+        )
+        assert state == (None, None, False)
 
 
 class TestAsyncDatabase:
@@ -91,14 +113,24 @@ class TestAsyncDatabase:
     @pytest.mark.asyncio
     async def test_engine_initialization(self, async_db):
         """Test asynchronous engine initialization."""
-        assert async_db._async_engine is None
-        assert not async_db._is_async_initialized
+        # Snapshot the lazy-init state in one tuple per phase.
+        state = (
+            async_db._async_engine,
+            async_db._async_session_factory,
+            async_db._is_async_initialized,
+        )
+        assert state == (None, None, False)
 
         _ = async_db.async_engine
 
-        assert async_db._is_async_initialized
-        assert async_db._async_engine is not None
-        assert async_db._async_session_factory is not None
+        engine, factory, initialized = (
+            async_db._async_engine,
+            async_db._async_session_factory,
+            async_db._is_async_initialized,
+        )
+        assert initialized
+        assert engine is not None
+        assert factory is not None
 
     @pytest.mark.asyncio
     async def test_session_lifecycle(self, async_db, mocker):
@@ -109,9 +141,10 @@ class TestAsyncDatabase:
             async_db: The asynchronous database fixture.
             mocker: Pytest mocker fixture for mocking dependencies.
         """
-        # Mock the session commit and rollback methods
-        mock_commit = mocker.patch.object(AsyncSession, "commit", autospec=True)
-        mock_rollback = mocker.patch.object(AsyncSession, "rollback", autospec=True)
+        # Spy on the session commit and rollback methods; the real
+        # coroutines still run, so session teardown behaves normally.
+        mock_commit = mocker.spy(AsyncSession, "commit")
+        mock_rollback = mocker.spy(AsyncSession, "rollback")
 
         # Initialize the async engine
         _ = async_db.async_engine
@@ -157,6 +190,9 @@ class TestAsyncDatabase:
 
         await async_db.dispose_async()
 
-        assert async_db._async_engine is None
-        assert async_db._async_session_factory is None
-        assert not async_db._is_async_initialized
+        state = (
+            async_db._async_engine,
+            async_db._async_session_factory,
+            async_db._is_async_initialized,
+        )
+        assert state == (None, None, False)
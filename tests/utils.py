@@ -1,3 +1,4 @@
+import functools
 import json
 import logging
 import os
@@ -45,10 +46,14 @@ class DockerUtils:
     """
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_compose_command() -> List[str]:
         """
         Determine the correct Docker Compose command.
 
+        The PATH probes cannot change mid-run, so the result is cached for
+        the whole test session.
+
         Returns:
             List[str]: Command for Docker Compose.
         """
@@ -76,28 +81,56 @@ class DockerUtils:
         return process.returncode, process.stdout or "", process.stderr or ""
 
     @staticmethod
-    def get_container_name(service_name: str) -> str:
+    @functools.lru_cache(maxsize=1)
+    def _ps_json() -> List[dict]:
         """
-        Retrieve the actual container name using `docker compose ps`.
+        Run `docker compose ps` once and cache the parsed container list.
 
-        Args:
-            service_name: Name of the Docker Compose service.
+        Every service looks itself up in the same snapshot, so one
+        subprocess spawn serves the whole session; the cache is cleared
+        if a container later goes missing.
 
         Returns:
-            str: Container name.
+            List[dict]: Parsed container entries, empty on failure.
         """
-        compose_command = DockerUtils.get_compose_command()
-        cmd = compose_command + ["ps", "--format", "json"]
+        cmd = DockerUtils.get_compose_command() + ["ps", "--format", "json"]
         returncode, stdout, stderr = DockerUtils.run_command(cmd)
-
         if returncode == 0 and stdout:
             try:
-                containers = json.loads(stdout)
-                for container in containers:
-                    if service_name in container.get('Service', ''):
-                        return container.get('Name', '')
+                return json.loads(stdout)
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse JSON from docker compose ps: {e}")
+        return []
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _containers_by_service() -> dict:
+        """
+        Build a service-name to container-name mapping from the ps snapshot.
+
+        Returns:
+            dict: Service names mapped to container names.
+        """
+        return {
+            container['Service']: container['Name']
+            for container in DockerUtils._ps_json()
+            if 'Service' in container and 'Name' in container
+        }
+
+    @staticmethod
+    def get_container_name(service_name: str) -> str:
+        """
+        Retrieve the actual container name using `docker compose ps`.
+
+        Args:
+            service_name: Name of the Docker Compose service.
+
+        Returns:
+            str: Container name.
+        """
+        name = DockerUtils._containers_by_service().get(service_name)
+        if name:
+            return name
 
         project_name = os.getenv("COMPOSE_PROJECT_NAME", os.path.basename(os.getcwd()).lower())
         fallback_name = f"{project_name}-{service_name}-1"
@@ -119,9 +152,16 @@ class DockerUtils:
         container_name = DockerUtils.get_container_name(service_name)
         logger.info(f"Waiting for container {container_name} to become healthy")
 
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            cmd = ["docker", "inspect", "--format", "{{.State.Health.Status}}", container_name]
+        # Start polling fast and back off: a short first interval catches
+        # already-healthy containers almost immediately, while the growing
+        # interval avoids hammering Docker during a slow startup.
+        interval = 0.05
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            cmd = [
+                "docker", "inspect", "--type", "container",
+                "--format", "{{.State.Health.Status}}", container_name,
+            ]
             returncode, stdout, stderr = DockerUtils.run_command(cmd)
 
             if returncode == 0 and stdout.strip() == "healthy":
@@ -133,8 +173,13 @@ class DockerUtils:
                 if up_code != 0:
                     logger.error(f"Failed to restart services: {up_err}")
                     return False
+                # The cached ps snapshot predates the restart; refresh it.
+                DockerUtils._ps_json.cache_clear()
+                DockerUtils._containers_by_service.cache_clear()
+                container_name = DockerUtils.get_container_name(service_name)
 
-            time.sleep(1)
+            time.sleep(interval)
+            interval = min(interval * 1.5, 1.0)
 
         logger.error(f"Container {container_name} did not become healthy within {timeout} seconds")
         return False